@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+
+# BSD 3-Clause License; see https://github.com/scikit-hep/uproot3/blob/master/LICENSE
+
+from os.path import join
+
+import numpy
+import pytest
+
+import uproot3
+
+def test_batch_empty(tmp_path):
+    filename = join(str(tmp_path), "example.root")
+
+    with uproot3.recreate(filename, compression=None) as f:
+        f["before"] = "x"
+        with open(filename, "rb") as file:
+            before = file.read()
+        with f.batch():
+            pass
+        with open(filename, "rb") as file:
+            assert file.read() == before
+
+    assert uproot3.open(filename)["before"] == b"x"
+
+def test_batch_exception(tmp_path):
+    filename = join(str(tmp_path), "example.root")
+
+    with uproot3.recreate(filename, compression=None) as f:
+        with pytest.raises(RuntimeError):
+            with f.batch():
+                for i in range(50):
+                    f["test%d" % i] = "value%d" % i
+                raise RuntimeError("interrupted")
+        assert f._batchdepth == 0
+        f["after"] = "y"
+
+    f = uproot3.open(filename)
+    assert len(f.keys()) == 51
+    assert f["test49"] == b"value49" and f["after"] == b"y"
+
+def test_batch_relocate(tmp_path):
+    filename = join(str(tmp_path), "example.root")
+
+    with uproot3.recreate(filename, compression=None) as f:
+        f["before"] = "x"
+        allocationbytes = f._rootdir.allocationbytes
+        seekkeys = f._rootdir.fSeekKeys
+        with f.batch():
+            for i in range(50):
+                f["test%d" % i] = "value%d" % i
+            assert f._rootdir.relocate
+        assert f._rootdir.allocationbytes > allocationbytes
+        assert f._rootdir.fSeekKeys != seekkeys
+
+    f = uproot3.open(filename)
+    assert f["before"] == b"x"
+    for i in range(50):
+        assert f["test%d" % i] == b"value%d" % i
+
+def test_batch_delete(tmp_path):
+    filename = join(str(tmp_path), "example.root")
+
+    with uproot3.recreate(filename, compression=None) as f:
+        with f.batch():
+            for i in range(50):
+                f["test%d" % i] = "value%d" % i
+            del f["test3"]
+            for i in range(50, 60):
+                f["test%d" % i] = "value%d" % i
+
+    f = uproot3.open(filename)
+    assert len(f.keys()) == 59
+    assert b"test3" not in f
+    for i in range(60):
+        if i != 3:
+            assert f["test%d" % i] == b"value%d" % i
+
+def test_batch_read(tmp_path):
+    filename = join(str(tmp_path), "example.root")
+
+    with uproot3.recreate(filename, compression=None) as f:
+        with f.batch():
+            f["a"] = "x"
+            f["b"] = "y"
+            assert f["b"] == b"y"
+            assert set(f.keys()) == set([b"a;1", b"b;1"])
+            f["c"] = "z"
+
+    f = uproot3.open(filename)
+    assert f["a"] == b"x" and f["b"] == b"y" and f["c"] == b"z"
+
+def test_batch_tree(tmp_path):
+    filename = join(str(tmp_path), "example.root")
+
+    with uproot3.recreate(filename, compression=None) as f:
+        with f.batch():
+            f["t"] = uproot3.newtree({"x": "int32"})
+            f["t"].extend({"x": numpy.arange(10, dtype="int32")})
+            assert f["t"].numentries == 10
+            f["t"].extend({"x": numpy.arange(5, dtype="int32")})
+
+    t = uproot3.open(filename)["t"]
+    assert t.array("x").tolist() == list(range(10)) + list(range(5))
+
+def test_batch_close(tmp_path):
+    filename = join(str(tmp_path), "example.root")
+
+    f = uproot3.recreate(filename, compression=None)
+    with f.batch():
+        for i in range(50):
+            f["test%d" % i] = "value%d" % i
+        f.close()
+        with pytest.raises(ValueError):
+            f["after"] = "x"
+
+    f = uproot3.open(filename)
+    assert len(f.keys()) == 50
+    for i in range(50):
+        assert f["test%d" % i] == b"value%d" % i
+
+def test_insert_writes(tmp_path):
+    # each plain assignment appends its key in place, so the bytes written grow linearly with the number of keys
+    written = {}
+    for n in (100, 400):
+        f = uproot3.recreate(join(str(tmp_path), "example%d.root" % n), compression=None)
+        written[n] = [0, 0]
+        write = f._sink.write
+        def counting(data, pos, total=written[n], write=write):
+            total[0] += len(data)
+            total[1] += 1
+            return write(data, pos)
+        f._sink.write = counting
+        for i in range(n):
+            f["name%d" % i] = "x"
+        f.close()
+
+    assert written[400][0] < 6 * written[100][0]
+    assert written[400][1] < 6 * written[100][1]
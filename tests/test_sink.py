@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+
+# BSD 3-Clause License; see https://github.com/scikit-hep/uproot3/blob/master/LICENSE
+
+import os
+import threading
+from os.path import join
+
+import numpy
+import pytest
+
+import uproot3.write.sink.file
+from uproot3.write.sink.file import FileSink
+
+def writes():
+    random = numpy.random.RandomState(12345)
+    out = []
+    pos = 0
+    for i in range(500):
+        data = random.randint(0, 256, random.randint(1, 100)).astype(numpy.uint8).tobytes()
+        if random.uniform() < 0.3:
+            out.append((data, random.randint(0, pos + 1)))     # overwrite or leave a gap before the end
+        else:
+            out.append((data, pos))                            # adjacent to the previous write
+            pos += len(data)
+    return out
+
+def reference(filename, writes):
+    with open(filename, "wb+") as file:
+        for data, pos in writes:
+            file.seek(pos)
+            file.write(data)
+    with open(filename, "rb") as file:
+        return file.read()
+
+def sinked(filename, writes, **options):
+    sink = FileSink(filename, **options)
+    for data, pos in writes:
+        sink.write(data, pos)
+    sink.close()
+    with open(filename, "rb") as file:
+        return file.read()
+
+def test_coalesce(tmp_path, monkeypatch):
+    calls = []
+    for name in ("pwritev", "pwrite"):
+        if hasattr(os, name):
+            def counting(fd, data, pos, original=getattr(os, name)):
+                calls.append(pos)
+                return original(fd, data, pos)
+            monkeypatch.setattr(os, name, counting)
+    out = sinked(join(str(tmp_path), "sink.bin"), writes())
+    assert out == reference(join(str(tmp_path), "reference.bin"), writes())
+    if len(calls) > 0:
+        assert len(calls) < len(writes())
+
+@pytest.mark.skipif(not hasattr(os, "pwritev"), reason="os.pwritev is not available")
+def test_partial_pwritev(tmp_path, monkeypatch):
+    pwrite = os.pwrite
+    monkeypatch.setattr(os, "pwritev", lambda fd, buffers, pos: pwrite(fd, b"".join(bytes(x) for x in buffers)[:7], pos))
+    out = sinked(join(str(tmp_path), "sink.bin"), writes())
+    assert out == reference(join(str(tmp_path), "reference.bin"), writes())
+
+@pytest.mark.skipif(not hasattr(os, "pwritev"), reason="os.pwritev is not available")
+def test_iovmax(tmp_path, monkeypatch):
+    monkeypatch.setattr(uproot3.write.sink.file, "_iovmax", 3)
+    out = sinked(join(str(tmp_path), "sink.bin"), writes())
+    assert out == reference(join(str(tmp_path), "reference.bin"), writes())
+
+@pytest.mark.skipif(not hasattr(os, "pwrite"), reason="os.pwrite is not available")
+def test_partial_pwrite(tmp_path, monkeypatch):
+    pwrite = os.pwrite
+    monkeypatch.delattr(os, "pwritev", raising=False)
+    monkeypatch.setattr(os, "pwrite", lambda fd, data, pos: pwrite(fd, bytes(data[:7]), pos))
+    out = sinked(join(str(tmp_path), "sink.bin"), writes())
+    assert out == reference(join(str(tmp_path), "reference.bin"), writes())
+
+def test_without_pwrite(tmp_path, monkeypatch):
+    monkeypatch.delattr(os, "pwritev", raising=False)
+    monkeypatch.delattr(os, "pwrite", raising=False)
+    out = sinked(join(str(tmp_path), "sink.bin"), writes())
+    assert out == reference(join(str(tmp_path), "reference.bin"), writes())
+
+def test_background(tmp_path):
+    for limitbytes in (1, 64, 4096):
+        out = sinked(join(str(tmp_path), "sink.bin"), writes(), limitbytes=limitbytes)
+        assert out == reference(join(str(tmp_path), "reference.bin"), writes())
+
+def test_background_error(tmp_path, monkeypatch):
+    threads = []
+    def failing(fd, data, pos):
+        threads.append(threading.current_thread())
+        raise OSError("disk full")
+    monkeypatch.setattr(os, "pwritev", failing, raising=False)
+    monkeypatch.setattr(os, "pwrite", failing, raising=False)
+
+    sink = FileSink(join(str(tmp_path), "sink.bin"), limitbytes=4)
+    sink.write(b"12345678", 0)
+    with pytest.raises(OSError):
+        sink.flush()
+    assert threads[0] is not threading.current_thread()
+    sink.close()
+
+    sink = FileSink(join(str(tmp_path), "sink.bin"), limitbytes=4)
+    sink.write(b"12345678", 0)
+    with pytest.raises(OSError):
+        sink.close()
+    assert sink.closed
+
+def test_closed(tmp_path):
+    sink = FileSink(join(str(tmp_path), "sink.bin"))
+    sink.write(b"1234", 0)
+    sink.close()
+    with pytest.raises(ValueError):
+        sink.write(b"5678", 4)
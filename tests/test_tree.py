@@ -677,3 +677,10 @@ class Test(object):
         t = uproot3.open("tests/samples/sample-5.23.02-zlib.root")["sample"]
         assert list(t.mempartitions(500)) == [(0, 2), (2, 4), (4, 6), (6, 8), (8, 10), (10, 12), (12, 14), (14, 16), (16, 18), (18, 20), (20, 22), (22, 24), (24, 26), (26, 28), (28, 30)]
         assert [sum(y.nbytes for y in x.values()) for x in t.iterate(entrysteps="0.5 kB")] == [693, 865, 822, 779, 951, 695, 867, 824, 781, 953, 695, 867, 824, 781, 953]
+
+    def test_mempartitions_executor(self):
+        concurrent_futures = pytest.importorskip("concurrent.futures")
+        t = uproot3.open("tests/samples/sample-5.23.02-zlib.root")["sample"]
+        executor = concurrent_futures.ThreadPoolExecutor(4)
+        assert list(t.mempartitions(500, executor=executor)) == list(t.mempartitions(500))
+        executor.shutdown()
@@ -2153,3 +2153,23 @@ def test_update(tmp_path):
     f = ROOT.TFile.Open(filename)
     for i in range(n):
         assert f.Get("test%d" % i).GetNbinsX() == 5, i
+
+def test_batch(tmp_path):
+    filename = join(str(tmp_path), "example.root")
+    n = 200
+
+    with uproot3.recreate(filename, compression=None) as f:
+        with f.batch():
+            for i in range(n):
+                f["test%d" % i] = "value%d" % i
+            f["test0"] = "again"
+
+    f = ROOT.TFile.Open(filename)
+    for i in range(n):
+        assert str(f.Get("test%d;1" % i)) == "value%d" % i
+    assert str(f.Get("test0;2")) == "again"
+    f.Close()
+
+    f = uproot3.open(filename)
+    assert len(f.keys()) == n + 1
+    assert f["test%d" % (n - 1)] == b"value%d" % (n - 1)
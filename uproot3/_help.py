@@ -915,6 +915,9 @@ u"""Return entry starts and stops as *(int, int)* pairs of (approximately) equal
     linear : bool
         if ``True`` *(default)*, the step size is uniform (same number of entries in each step); any variations in entry size as a function of entry number are averaged over. Non-linear steps (``False``), which would take into account bigger entry sizes at the beginning or end of the file, have not been implemented.
 
+    executor : `concurrent.futures.Executor <https://docs.python.org/3/library/concurrent.futures.html>`_
+        if not ``None`` *(default)*, read the basket sizes of each branch in parallel by scheduling one task per branch on the executor. Assumes caches are thread-safe.
+
     Returns
     -------
     list of (int, int)
@@ -5,6 +5,7 @@
 from __future__ import absolute_import
 
 import base64
+import bisect
 import codecs
 import glob
 import importlib
@@ -423,7 +424,7 @@ class TTreeMethods(object):
         else:
             return True
 
-    def mempartitions(self, numbytes, branches=None, entrystart=None, entrystop=None, keycache=None, linear=True):
+    def mempartitions(self, numbytes, branches=None, entrystart=None, entrystop=None, keycache=None, linear=True, executor=None):
         m = _memsize(numbytes)
         if m is not None:
             numbytes = m
@@ -439,15 +440,14 @@ class TTreeMethods(object):
             raise NotImplementedError("non-linear mempartition has not been implemented")
 
         relevant_numbytes = 0.0
-        for branch, interpretation in branches:
-            if branch._recoveredbaskets is None:
-                branch._tryrecover()
-            for i, key in enumerate(branch._threadsafe_iterate_keys(keycache, False)):
-                start, stop = branch._entryoffsets[i], branch._entryoffsets[i + 1]
-                if entrystart < stop and start < entrystop:
-                    this_numbytes = key._fObjlen * (min(stop, entrystop) - max(start, entrystart)) / float(stop - start)
-                    assert this_numbytes >= 0.0
-                    relevant_numbytes += this_numbytes
+        if executor is None:
+            for branch, interpretation in branches:
+                relevant_numbytes += branch._relevant_numbytes(entrystart, entrystop, keycache)
+        else:
+            # each branch reads its own basket keys, so the branches are independent tasks
+            futures = [executor.submit(branch._relevant_numbytes, entrystart, entrystop, keycache) for branch, interpretation in branches]
+            for future in futures:
+                relevant_numbytes += future.result()
 
         entrysteps = max(1, int(round(math.ceil((entrystop - entrystart) * numbytes / relevant_numbytes))))
 
@@ -466,14 +466,18 @@ class TTreeMethods(object):
         class BranchCursor(object):
             def __init__(self, branch):
                 self.branch = branch
+                self.numbaskets = branch.numbaskets
+                self.entryoffsets = branch._entryoffsets
                 self.basketstart = 0
                 self.basketstop = 0
             @property
             def entrystart(self):
-                return self.branch.basket_entrystart(self.basketstart)
+                if self.basketstart >= self.numbaskets:
+                    raise IndexError("index {0} out of range for branch with {1} baskets".format(self.basketstart, self.numbaskets))
+                return self.entryoffsets[self.basketstart]
             @property
             def entrystop(self):
-                return self.branch.basket_entrystop(self.basketstop)
+                return self.entryoffsets[self.basketstop + 1]
 
         cursors = [BranchCursor(branch) for branch, interpretation in branches if branch.numbaskets > 0]
 
@@ -493,7 +497,7 @@ class TTreeMethods(object):
             entrystart, entrystop = _normalize_entrystartstop(self.numentries, entrystart, entrystop)
 
             # move all cursors forward, yielding a (start, stop) pair if their baskets line up
-            while any(cursor.basketstop < cursor.branch.numbaskets for cursor in cursors):
+            while any(cursor.basketstop < cursor.numbaskets for cursor in cursors):
                 # move all subleading baskets forward until they are no longer subleading
                 leadingstop = max(cursor.entrystop for cursor in cursors)
                 for cursor in cursors:
@@ -607,7 +611,7 @@ class TTreeMethods(object):
         entrystart, entrystop = _normalize_entrystartstop(self.numentries, entrystart, entrystop)
         if not chunked and entrysteps is None:
             entrysteps = float('inf')
-        entrysteps = list(self._normalize_entrysteps(entrysteps, branches, entrystart, entrystop, keycache))
+        entrysteps = list(self._normalize_entrysteps(entrysteps, branches, entrystart, entrystop, keycache, executor))
         awkward0 = _normalize_awkwardlib(awkwardlib)
         branches = list(self._normalize_branches(branches, awkward0))
         for branch, interpretation in branches:
@@ -646,10 +650,10 @@ class TTreeMethods(object):
             out = uproot3_methods.profiles.transformer(profile)(out)
         return out
 
-    def _normalize_entrysteps(self, entrysteps, branches, entrystart, entrystop, keycache):
+    def _normalize_entrysteps(self, entrysteps, branches, entrystart, entrystop, keycache, executor=None):
         numbytes = _memsize(entrysteps)
         if numbytes is not None:
-            return self.mempartitions(numbytes, branches=branches, entrystart=entrystart, entrystop=entrystop, keycache=keycache, linear=True)
+            return self.mempartitions(numbytes, branches=branches, entrystart=entrystart, entrystop=entrystop, keycache=keycache, linear=True, executor=executor)
         if isinstance(entrysteps, string_types):
             raise ValueError("string {0} does not match the memory size pattern (number followed by B/kB/MB/GB/etc.)".format(repr(entrysteps)))
 
@@ -687,7 +691,7 @@ class TTreeMethods(object):
             explicit_basketcache = True
 
         entrystart, entrystop = _normalize_entrystartstop(self.numentries, entrystart, entrystop)
-        entrysteps = self._normalize_entrysteps(entrysteps, branches, entrystart, entrystop, keycache)
+        entrysteps = self._normalize_entrysteps(entrysteps, branches, entrystart, entrystop, keycache, executor)
         awkward0 = _normalize_awkwardlib(awkwardlib)
         branches = list(self._normalize_branches(branches, awkward0))
         for branch, interpretation in branches:
@@ -939,6 +943,8 @@ class TBranchMethods(object):
             self._entryoffsets = None
             self._recoverylock = threading.Lock()
 
+        self._basketarrays = None
+
         self._countbranch = None
         self._tree_iofeatures = 0
         if hasattr(parent, "_fIOFeatures"):
@@ -1292,19 +1298,15 @@ class TBranchMethods(object):
             return out
 
     def _basketstartstop(self, entrystart, entrystop):
-        basketstart, basketstop = None, None
-        for i in range(self.numbaskets):
-            if basketstart is None:
-                if entrystart < self.basket_entrystop(i) and self.basket_entrystart(i) < entrystop:
-                    basketstart = i
-                    basketstop = i
-            else:
-                if self.basket_entrystart(i) < entrystop:
-                    basketstop = i
+        numbaskets = self.numbaskets
+        offsets = self._entryoffsets
 
-        if basketstop is not None:
-            basketstop += 1    # stop is exclusive
+        # entry offsets are sorted, so the overlapping baskets are found by bisection rather than a scan over all baskets
+        basketstart = bisect.bisect_right(offsets, entrystart, 1, numbaskets + 1) - 1
+        if basketstart == numbaskets or not offsets[basketstart] < entrystop:
+            return None, None
 
+        basketstop = bisect.bisect_left(offsets, entrystop, basketstart, numbaskets)    # stop is exclusive
         return basketstart, basketstop
 
     def baskets(self, interpretation=None, entrystart=None, entrystop=None, flatten=False, awkwardlib=None, cache=None, basketcache=None, keycache=None, reportentries=False, executor=None, blocking=True):
@@ -1587,15 +1589,7 @@ class TBranchMethods(object):
         if not linear:
             raise NotImplementedError("non-linear mempartition has not been implemented")
 
-        relevant_numbytes = 0.0
-        if self._recoveredbaskets is None:
-            self._tryrecover()
-        for i, key in enumerate(self._threadsafe_iterate_keys(keycache, False)):
-            start, stop = self._entryoffsets[i], self._entryoffsets[i + 1]
-            if entrystart < stop and start < entrystop:
-                this_numbytes = key._fObjlen * (min(stop, entrystop) - max(start, entrystart)) / float(stop - start)
-                assert this_numbytes >= 0.0
-                relevant_numbytes += this_numbytes
+        relevant_numbytes = self._relevant_numbytes(entrystart, entrystop, keycache)
 
         entrysteps = max(1, round(math.ceil((entrystop - entrystart) * numbytes / relevant_numbytes)))
 
@@ -1606,6 +1600,28 @@ class TBranchMethods(object):
                 yield start, stop
             start = stop
 
+    def _basket_arrays(self, keycache):
+        # basket metadata does not change once the file is open, so the arrays are built at most once per branch
+        if self._basketarrays is None:
+            if self._recoveredbaskets is None:
+                self._tryrecover()
+            entryoffsets = numpy.array(self._entryoffsets, dtype=numpy.int64)
+            objlen = numpy.array([key._fObjlen for key in self._threadsafe_iterate_keys(keycache, False)], dtype=numpy.int64)
+            self._basketarrays = entryoffsets, objlen
+        return self._basketarrays
+
+    def _relevant_numbytes(self, entrystart, entrystop, keycache):
+        if self.numbaskets == 0:
+            return 0.0
+
+        # one array per basket property, so that the overlap of every basket with [entrystart, entrystop) is computed at once
+        offsets, objlen = self._basket_arrays(keycache)
+        starts, stops = offsets[:-1], offsets[1:]
+
+        mask = (entrystart < stops) & (starts < entrystop) & (starts < stops)
+        overlap = numpy.minimum(stops[mask], entrystop) - numpy.maximum(starts[mask], entrystart)
+        return float((objlen[mask].astype(numpy.float64) * overlap / (stops[mask] - starts[mask])).sum())
+
     def _normalize_entrysteps(self, entrysteps, entrystart, entrystop, keycache):
         numbytes = _memsize(entrysteps)
         if numbytes is not None:
@@ -1872,6 +1888,7 @@ class _LazyFiles(object):
 
     def _init(self):
         self.trees = cachetools.LRUCache(5)                                 # last 5 TTrees
+        self.interpretations = {}                                           # per path, outlives the TTrees
         if self.basketcache is None:
             self.basketcache = uproot3.cache.ThreadSafeArrayCache(1024**2)   # 1 MB
         if self.keycache is None:
@@ -1909,11 +1926,14 @@ class _LazyFiles(object):
 
     def __call__(self, pathi, branchname):
         awkward0 = _normalize_awkwardlib(self.awkwardlib)
-        tree = self.trees.get(self.paths[pathi], None)
+        path = self.paths[pathi]
+        tree = self.trees.get(path, None)
         if tree is None:
-            tree = self.trees[self.paths[pathi]] = uproot3.rootio.open(self.paths[pathi])[self.treepath]
-            tree.interpretations = dict((b.name, x) for b, x in tree._normalize_branches(self.branches, awkward0))
-        return tree[branchname].lazyarray(interpretation=tree.interpretations[branchname], entrysteps=self.entrysteps, entrystart=None, entrystop=None, flatten=self.flatten, awkwardlib=awkward0, cache=None, basketcache=self.basketcache, keycache=self.keycache, executor=self.executor, persistvirtual=self.persistvirtual)
+            tree = self.trees[path] = uproot3.rootio.open(path)[self.treepath]
+        interpretations = self.interpretations.get(path, None)
+        if interpretations is None:
+            interpretations = self.interpretations[path] = dict((b.name, x) for b, x in tree._normalize_branches(self.branches, awkward0))
+        return tree[branchname].lazyarray(interpretation=interpretations[branchname], entrysteps=self.entrysteps, entrystart=None, entrystop=None, flatten=self.flatten, awkwardlib=awkward0, cache=None, basketcache=self.basketcache, keycache=self.keycache, executor=self.executor, persistvirtual=self.persistvirtual)
 
 class _LazyTree(object):
     def __init__(self, path, treepath, tree, interpretation, flatten, awkwardlib, basketcache, keycache, executor):
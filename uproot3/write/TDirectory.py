@@ -34,6 +34,9 @@ class TDirectory(object):
         self.keys = collections.OrderedDict()
         self.maxcycle = collections.Counter()
 
+        self.dirty = False
+        self.relocate = False
+
     def size(self):
         return uproot3.write.sink.cursor.Cursor.length_string(self.fName) + 1 + self._format1.size + len(self.fUUID) + 12
 
@@ -58,7 +61,8 @@ class TDirectory(object):
     _format2 = struct.Struct(">i")
 
     def _nbyteskeys(self):
-        return self.headkey.fKeylen + self._format2.size + sum(x.fKeylen for x in self.keys.values())
+        # headkey.fObjlen is kept equal to the key count field plus the sum of all key lengths as keys are set and deleted
+        return self.headkey.fKeylen + self.headkey.fObjlen
 
     def writekeys(self, cursor):
         self.fSeekKeys = cursor.index
@@ -66,6 +70,9 @@ class TDirectory(object):
 
         self.tfile._expandfile(uproot3.write.sink.cursor.Cursor(self.fSeekKeys + self.allocationbytes))
 
+        self.dirty = False
+        self.relocate = False
+
         self.keycursor = uproot3.write.sink.cursor.Cursor(self.fSeekKeys)
         self.headkey.write(self.keycursor, self.sink)
         self.nkeycursor = uproot3.write.sink.cursor.Cursor(self.keycursor.index)
@@ -93,7 +100,11 @@ class TDirectory(object):
             self.allocationbytes *= self.growfactor
             newcursor = uproot3.write.sink.cursor.Cursor(self.tfile._fSeekFree)
 
-        if newcursor is not None:
+        if self.tfile._batchdepth > 0:
+            self.dirty = True
+            if newcursor is not None and newcursor.index != self.fSeekKeys:
+                self.relocate = True
+        elif newcursor is not None:
             self.writekeys(newcursor)
         else:
             newkey.write(self.keycursor, self.sink)
@@ -101,6 +112,12 @@ class TDirectory(object):
             self.nkeycursor.update_fields(self.sink, self._format2, len(self.keys))
             self.update()
 
+    def writedirty(self):
+        if self.relocate:
+            self.writekeys(uproot3.write.sink.cursor.Cursor(self.tfile._fSeekFree))
+        elif self.dirty:
+            self.writekeys(uproot3.write.sink.cursor.Cursor(self.fSeekKeys))
+
     def delkey(self, name, cycle):
         if cycle is None:
             for x in range(self.maxcycle[name]):
@@ -112,4 +129,7 @@ class TDirectory(object):
             del self.keys[(name, cycle)]
 
             self.fNbytesKeys = self._nbyteskeys()
-            self.writekeys(uproot3.write.sink.cursor.Cursor(self.fSeekKeys))
+            if self.tfile._batchdepth > 0:
+                self.dirty = True
+            else:
+                self.writekeys(uproot3.write.sink.cursor.Cursor(self.fSeekKeys))
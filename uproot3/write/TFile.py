@@ -4,6 +4,7 @@
 
 from __future__ import absolute_import
 
+import contextlib
 import os
 import sys
 import struct
@@ -48,6 +49,9 @@ class TFileUpdate(object):
 
         self.compression = compression
         self._treedict = {}
+        self._batchdepth = 0
+        self._freedepth = 0
+        self._dirtyfree = False
 
         self._sink = uproot3.write.sink.file.FileSink(path)
         self._path = path
@@ -82,30 +86,58 @@ class TFileUpdate(object):
             raise TypeError("{0} not supported".format(options))
 
     def __setitem__(self, where, what):
-        self.util = Util()
-        where, cycle = self._normalizewhere(where)
-        if what.__class__.__name__ != "TTree" and what.__class__.__name__ != "newtree":
-            what = uproot3_methods.convert.towriteable(what)
-        elif what.__class__.__name__ == "newtree":
-            what = TTree(where, what, self)
-        cursor = uproot3.write.sink.cursor.Cursor(self._fSeekFree)
-        newkey = uproot3.write.TKey.TKey(fClassName = what._fClassName,
-                                         fName      = where,
-                                         fTitle     = what._fTitle,
-                                         fObjlen    = 0,
-                                         fSeekKey   = self._fSeekFree,
-                                         fSeekPdir  = self._fBEGIN,
-                                         fCycle     = cycle if cycle is not None else self._rootdir.newcycle(where))
-        if what.__class__.__name__ == "newtree" or what.__class__.__name__ == "TTree":
-            # Need to (re)attach the cycle number to allow getitem to access writable TTree
-            tree_where = where + b";" + str(newkey.fCycle).encode("utf-8")
-            self._treedict[tree_where] = what
-        newkeycursor = uproot3.write.sink.cursor.Cursor(newkey.fSeekKey)
-        newkey.write(cursor, self._sink)
-        what._write(self, cursor, where, self.compression, newkey, newkeycursor, self.util)
-        self._expandfile(cursor)
+        with self._deferfree():
+            self.util = Util()
+            where, cycle = self._normalizewhere(where)
+            if what.__class__.__name__ != "TTree" and what.__class__.__name__ != "newtree":
+                what = uproot3_methods.convert.towriteable(what)
+            elif what.__class__.__name__ == "newtree":
+                what = TTree(where, what, self)
+            cursor = uproot3.write.sink.cursor.Cursor(self._fSeekFree)
+            newkey = uproot3.write.TKey.TKey(fClassName = what._fClassName,
+                                             fName      = where,
+                                             fTitle     = what._fTitle,
+                                             fObjlen    = 0,
+                                             fSeekKey   = self._fSeekFree,
+                                             fSeekPdir  = self._fBEGIN,
+                                             fCycle     = cycle if cycle is not None else self._rootdir.newcycle(where))
+            if what.__class__.__name__ == "newtree" or what.__class__.__name__ == "TTree":
+                # Need to (re)attach the cycle number to allow getitem to access writable TTree
+                tree_where = where + b";" + str(newkey.fCycle).encode("utf-8")
+                self._treedict[tree_where] = what
+            newkeycursor = uproot3.write.sink.cursor.Cursor(newkey.fSeekKey)
+            newkey.write(cursor, self._sink)
+            what._write(self, cursor, where, self.compression, newkey, newkeycursor, self.util)
+            self._expandfile(cursor)
+
+            self._rootdir.setkey(newkey)
 
-        self._rootdir.setkey(newkey)
+    @contextlib.contextmanager
+    def batch(self):
+        self._batchdepth += 1
+        try:
+            yield self
+        finally:
+            self._batchdepth -= 1
+            if self._batchdepth == 0:
+                self._sync()
+
+    @contextlib.contextmanager
+    def _deferfree(self):
+        self._freedepth += 1
+        try:
+            yield
+        finally:
+            self._freedepth -= 1
+            if self._freedepth == 0 and self._batchdepth == 0:
+                if self._dirtyfree:
+                    self._writefree()
+                self._sink.flush()
+
+    def _sync(self):
+        self._rootdir.writedirty()
+        if self._dirtyfree:
+            self._writefree()
         self._sink.flush()
 
     def update(self, *args, **kwargs):
@@ -160,7 +192,8 @@ class TFileUpdate(object):
         self._rootdir.writekeys(cursor)
 
         self._expandfile(cursor)
-        self._sink.flush()
+        if self._batchdepth == 0:
+            self._sink.flush()
 
     def __delitem__(self, where):
         where, cycle = self._normalizewhere(where)
@@ -170,6 +203,7 @@ class TFileUpdate(object):
             raise KeyError("ROOT directory does not contain key {0}".format(where))
 
     def _reopen(self):
+        self._sync()
         return uproot3.open(self._path, localsource=lambda path: uproot3.source.file.FileSource(path, **uproot3.source.file.FileSource.defaults))
 
     @property
@@ -256,6 +290,8 @@ class TFileUpdate(object):
         return self._sink.closed
 
     def close(self):
+        if not self._sink.closed:
+            self._sync()
         self._sink.close()
 
     def __enter__(self):
@@ -330,20 +366,27 @@ class TFileRecreate(TFileUpdate):
 
     def _expandfile(self, cursor):
         if cursor.index > self._fSeekFree:
-            freecursor = uproot3.write.sink.cursor.Cursor(cursor.index)
-            freekey = uproot3.write.TKey.TKey(b"TFile", self._filename, fObjlen=0, fSeekKey=cursor.index, fSeekPdir=self._fBEGIN)
-            freeseg = uproot3.write.TFree.TFree(cursor.index + freekey.fNbytes)
-            freekey.fObjlen = freeseg.size()
-            freekey.fNbytes += freekey.fObjlen
-
-            freekey.write(freecursor, self._sink)
-            freeseg.write(freecursor, self._sink)
-
             self._fSeekFree = cursor.index
-            self._fEND = cursor.index + freekey.fNbytes
-            self._fNbytesFree = freekey.fNbytes
-            self._nfree = 1
-            self._endcursor.update_fields(self._sink, self._format_end, self._fEND, self._fSeekFree, self._fNbytesFree, self._nfree)
+            if self._batchdepth > 0 or self._freedepth > 0:
+                self._dirtyfree = True
+            else:
+                self._writefree()
+
+    def _writefree(self):
+        freecursor = uproot3.write.sink.cursor.Cursor(self._fSeekFree)
+        freekey = uproot3.write.TKey.TKey(b"TFile", self._filename, fObjlen=0, fSeekKey=self._fSeekFree, fSeekPdir=self._fBEGIN)
+        freeseg = uproot3.write.TFree.TFree(self._fSeekFree + freekey.fNbytes)
+        freekey.fObjlen = freeseg.size()
+        freekey.fNbytes += freekey.fObjlen
+
+        freekey.write(freecursor, self._sink)
+        freeseg.write(freecursor, self._sink)
+
+        self._fEND = self._fSeekFree + freekey.fNbytes
+        self._fNbytesFree = freekey.fNbytes
+        self._nfree = 1
+        self._endcursor.update_fields(self._sink, self._format_end, self._fEND, self._fSeekFree, self._fNbytesFree, self._nfree)
+        self._dirtyfree = False
 
     def _writerootdir(self):
         cursor = uproot3.write.sink.cursor.Cursor(self._fBEGIN)
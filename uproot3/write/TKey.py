@@ -10,6 +10,8 @@ import uproot3.write.sink.cursor
 import uproot3.write.util
 
 class BasketKey(object):
+    __slots__ = ("fClassName", "fName", "fTitle", "fObjlen", "fSeekKey", "fSeekPdir", "fCycle", "fDatime", "fNbytes", "fBufferSize", "fNevBuf", "fNevBufSize", "old_fLast", "cursor", "sink")
+
     def __init__(self, fName, fTitle, fNevBuf, fNevBufSize, fObjlen=0, fSeekKey=100, fSeekPdir=0, fBufferSize=0):
         self.fClassName = b"TBasket"
         self.fName = fName
@@ -42,28 +44,31 @@ class BasketKey(object):
         self.cursor = uproot3.write.sink.cursor.Cursor(cursor.index)
         self.sink = sink
 
-        self.update()
-
-        cursor.skip(self._format1.size)
-        cursor.write_string(sink, self.fClassName)
-        cursor.write_string(sink, self.fName)
-        cursor.write_string(sink, self.fTitle)
+        # the whole key is packed into one buffer and handed to the sink in a single write
+        buff = (cursor.put_fields(self._format1, self.fNbytes, self._version, self.fObjlen, self.fDatime, self.fKeylen, self.fCycle, self.fSeekKey, self.fSeekPdir) +
+                cursor.put_string(self.fClassName) +
+                cursor.put_string(self.fName) +
+                cursor.put_string(self.fTitle))
 
         basketversion = 3
         if isjagged:
             if self.old_fLast == 0:
                 raise Exception("isjagged flag should be False")
-            cursor.write_fields(sink, self._format_basketkey, basketversion, self.fBufferSize, self.fNevBufSize, self.fNevBuf, self.old_fLast)
+            buff += cursor.put_fields(self._format_basketkey, basketversion, self.fBufferSize, self.fNevBufSize, self.fNevBuf, self.old_fLast)
         else:
-            cursor.write_fields(sink, self._format_basketkey, basketversion, self.fBufferSize, self.fNevBufSize, self.fNevBuf, self.fLast)
+            buff += cursor.put_fields(self._format_basketkey, basketversion, self.fBufferSize, self.fNevBufSize, self.fNevBuf, self.fLast)
             self.old_fLast = self.fLast
-        cursor.write_data(sink, b"\x00")
+        buff += cursor.put_data(b"\x00")
+        sink.write(buff, self.cursor.index)
 
     _version = 1004
     _format1 = struct.Struct(">ihiIhhqq")
     _format_basketkey = struct.Struct(">Hiiii")
 
 class TKey(object):
+    # a TDirectory holds one TKey per entry for the lifetime of the file
+    __slots__ = ("fClassName", "fName", "fTitle", "fObjlen", "fSeekKey", "fSeekPdir", "fCycle", "fDatime", "fNbytes", "cursor", "sink")
+
     def __init__(self, fClassName, fName, fTitle=b"", fObjlen=0, fSeekKey=100, fSeekPdir=0, fCycle=1):
         self.fClassName = fClassName
         self.fName = fName
@@ -89,16 +94,17 @@ class TKey(object):
         self.cursor = uproot3.write.sink.cursor.Cursor(cursor.index)
         self.sink = sink
 
-        self.update()
-
-        cursor.skip(self._format1.size)
-        cursor.write_string(sink, self.fClassName)
-        cursor.write_string(sink, self.fName)
-        cursor.write_string(sink, self.fTitle)
+        buff = (cursor.put_fields(self._format1, self.fNbytes, self._version, self.fObjlen, self.fDatime, self.fKeylen, self.fCycle, self.fSeekKey, self.fSeekPdir) +
+                cursor.put_string(self.fClassName) +
+                cursor.put_string(self.fName) +
+                cursor.put_string(self.fTitle))
+        sink.write(buff, self.cursor.index)
 
     _version = 1004
     _format1 = struct.Struct(">ihiIhhqq")
 
 class TKey32(TKey):
+    __slots__ = ()
+
     _version = 4
     _format1 = struct.Struct(">ihiIhhii")
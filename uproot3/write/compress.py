@@ -53,6 +53,8 @@ algo = {uproot3.const.kZLIB: ZLIB,
         uproot3.const.kLZMA: LZMA,
         uproot3.const.kLZ4: LZ4}
 
+_header = struct.Struct("2sBBBBBBB")
+
 def write(context, cursor, givenbytes, compression, key, keycursor, isjagged=False):
     retaincursor = copy.copy(keycursor)
     if compression is None:
@@ -60,7 +62,6 @@ def write(context, cursor, givenbytes, compression, key, keycursor, isjagged=Fal
     else:
         algorithm, level = compression.pair
 
-    _header = struct.Struct("2sBBBBBBB")
     uncompressedbytes = len(givenbytes)
 
     if algorithm == 0 or level == 0:
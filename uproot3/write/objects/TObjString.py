@@ -30,8 +30,10 @@ class TObjString(object):
         write_cursor = copy(cursor)
         cursor.skip(self._format.size)
         vers = 1
-        buff = cursor.put_string(self.value)
-        length = len(buff) + self._format.size
+        length = self._format.size + cursor.length_string(self.value)
         cnt = numpy.int64(length - 4) | uproot3.const.kByteCountMask
-        givenbytes = copy_cursor.put_fields(self._format, cnt, vers, 1, 0, uproot3.const.kNotDeleted) + buff
+        # joined in one step, so that a large string is copied only once
+        givenbytes = b"".join([copy_cursor.put_fields(self._format, cnt, vers, 1, 0, uproot3.const.kNotDeleted),
+                               cursor.put_stringlength(self.value),
+                               cursor.put_data(self.value)])
         uproot3.write.compress.write(context, write_cursor, givenbytes, compression, key, keycursor)
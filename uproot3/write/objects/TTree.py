@@ -54,7 +54,7 @@ class TTree(object):
         self._file = file
 
         self._branches = {}
-        checker = []
+        checker = set()
         for name, branch in newtree.branches.items():
             if isinstance(branch, newbranch) == False:
                 branch = newbranch(branch)
@@ -72,8 +72,8 @@ class TTree(object):
                     elif "?" in newtree.branches[name].type.str or newtree.branches[name].type.str == numpy.dtype(">?") or newtree.branches[name].type.str == numpy.dtype("<?"):
                         raise NotImplementedError("Booleans cannot be read properly by ROOT yet")
                 if branch.counter not in checker:
-                    checker += [branch.counter]
-                    if branch.counter not in newtree.branches.keys():
+                    checker.add(branch.counter)
+                    if branch.counter not in newtree.branches:
                         dummybranch = newbranch(">i4")
                         dummybranch._iscounter = True
                         compression = getattr(dummybranch, "compression", getattr(newtree, "compression", file.compression))
@@ -118,7 +118,7 @@ class TTree(object):
         tempdict = {}
         for key, value in branchdict.items():
             if self._branches[key]._branch.counter is not None:
-                if self._branches[key]._branch.counter in tempdict.keys():
+                if self._branches[key]._branch.counter in tempdict:
                     if not ((tempdict[self._branches[key]._branch.counter].counts == value.counts).all()):
                         raise Exception("Lengths of jagged arrays depending on the same lengths branch should be the same")
                 else:
@@ -129,14 +129,15 @@ class TTree(object):
             if not isinstance(value, awkward0.array.jagged.JaggedArray):
                 branchdict[key] = numpy.array(value, dtype=self._branches[key]._branch.type, copy=False)
 
-        for key, value in branchdict.items():
-            if isinstance(value, awkward0.array.jagged.JaggedArray):
-                self._branches[key].newbasket(value)
-            elif value.ndim == 1:
-                self._branches[key].newbasket(value)
-            else:
-                for i in range(0, value.shape[0]):
-                    self._branches[key].newbasket(value[i], i + 1)
+        with self._file.batch():
+            for key, value in branchdict.items():
+                if isinstance(value, awkward0.array.jagged.JaggedArray):
+                    self._branches[key].newbasket(value)
+                elif value.ndim == 1:
+                    self._branches[key].newbasket(value)
+                else:
+                    for i in range(0, value.shape[0]):
+                        self._branches[key].newbasket(value[i], i + 1)
 
     @property
     def name(self):
@@ -146,9 +147,13 @@ class TTree(object):
     def title(self):
         return self._tree.fTitle
 
+    def _reopen(self):
+        self._file._sync()
+        return uproot3.open(self._file._path)[self.name]
+
     @property
     def numentries(self):
-        t = uproot3.open(self._file._path)[self.name]
+        t = self._reopen()
         return t.numentries
 
     @property
@@ -156,83 +161,83 @@ class TTree(object):
         return len(self._branches)
 
     def iterkeys(self, recursive=False, filtername=nofilter, filtertitle=nofilter, aliases=True):
-        t = uproot3.open(self._file._path)[self.name]
+        t = self._reopen()
         return t.iterkeys(recursive, filtername, filtertitle, aliases)
 
     def itervalues(self, recursive=False, filtername=nofilter, filtertitle=nofilter):
-        t = uproot3.open(self._file._path)[self.name]
+        t = self._reopen()
         return t.itervalues(recursive, filtername, filtertitle)
 
     def iteritems(self, recursive=False, filtername=nofilter, filtertitle=nofilter, aliases=True):
-        t = uproot3.open(self._file._path)[self.name]
+        t = self._reopen()
         return t.iteritems(recursive, filtername, filtertitle, aliases)
 
     def keys(self, recursive=False, filtername=nofilter, filtertitle=nofilter, aliases=True):
-        t = uproot3.open(self._file._path)[self.name]
+        t = self._reopen()
         return t.keys(recursive, filtername, filtertitle, aliases)
 
     def values(self, recursive=False, filtername=nofilter, filtertitle=nofilter):
-        t = uproot3.open(self._file._path)[self.name]
+        t = self._reopen()
         return t.values(recursive, filtername, filtertitle)
 
     def items(self, recursive=False, filtername=nofilter, filtertitle=nofilter, aliases=True):
-        t = uproot3.open(self._file._path)[self.name]
+        t = self._reopen()
         return t.items(recursive, filtername, filtertitle, aliases)
 
     def allkeys(self, filtername=nofilter, filtertitle=nofilter, aliases=True):
-        t = uproot3.open(self._file._path)[self.name]
+        t = self._reopen()
         return t.allkeys(filtername, filtertitle, aliases)
 
     def allvalues(self, filtername=nofilter, filtertitle=nofilter):
-        t = uproot3.open(self._file._path)[self.name]
+        t = self._reopen()
         return t.allvalues(filtername, filtertitle)
 
     def allitems(self, filtername=nofilter, filtertitle=nofilter, aliases=True):
-        t = uproot3.open(self._file._path)[self.name]
+        t = self._reopen()
         return t.allitems(filtername, filtertitle, aliases)
 
     def get(self, name, recursive=True, filtername=nofilter, filtertitle=nofilter, aliases=True):
-        t = uproot3.open(self._file._path)[self.name]
+        t = self._reopen()
         return t.get(name, recursive, filtername, filtertitle, aliases)
 
     def __contains__(self, name):
-        t = uproot3.open(self._file._path)[self.name]
+        t = self._reopen()
         return t.__contains__(name)
 
-    def mempartitions(self, numbytes, branches=None, entrystart=None, entrystop=None, keycache=None, linear=True):
-        t = uproot3.open(self._file._path)[self.name]
-        return t.mempartitions(numbytes, branches, entrystart, entrystop, keycache, linear)
+    def mempartitions(self, numbytes, branches=None, entrystart=None, entrystop=None, keycache=None, linear=True, executor=None):
+        t = self._reopen()
+        return t.mempartitions(numbytes, branches, entrystart, entrystop, keycache, linear, executor)
 
     def clusters(self, branches=None, entrystart=None, entrystop=None, strict=False):
-        t = uproot3.open(self._file._path)[self.name]
+        t = self._reopen()
         return t.clusters(branches, entrystart, entrystop, strict)
 
     def array(self, branch, interpretation=None, entrystart=None, entrystop=None, flatten=False, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None, blocking=True):
-        t = uproot3.open(self._file._path)[self.name]
+        t = self._reopen()
         return t.array(branch, interpretation, entrystart, entrystop, flatten, awkwardlib, cache, basketcache, keycache, executor, blocking)
 
     def arrays(self, branches=None, outputtype=dict, namedecode=None, entrystart=None, entrystop=None, flatten=False, flatname=None, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None, blocking=True):
-        t = uproot3.open(self._file._path)[self.name]
+        t = self._reopen()
         return t.arrays(branches, outputtype, namedecode, entrystart, entrystop, flatten, flatname, awkwardlib, cache, basketcache, keycache, executor, blocking)
 
     def lazyarray(self, branch, interpretation=None, entrysteps=None, entrystart=None, entrystop=None, flatten=False, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None, persistvirtual=False):
-        t = uproot3.open(self._file._path)[self.name]
+        t = self._reopen()
         return t.lazyarray(branch, interpretation, entrysteps, entrystart, entrystop, flatten, awkwardlib, cache, basketcache, keycache, executor, persistvirtual)
 
     def lazyarrays(self, branches=None, namedecode="utf-8", entrysteps=None, entrystart=None, entrystop=None, flatten=False, profile=None, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None, persistvirtual=False):
-        t = uproot3.open(self._file._path)[self.name]
+        t = self._reopen()
         return t.lazyarrays(branches, namedecode, entrysteps, entrystart, entrystop, flatten, profile, awkwardlib, cache, basketcache, keycache, executor, persistvirtual)
 
     def iterate(self, branches=None, entrysteps=None, outputtype=dict, namedecode=None, reportentries=False, entrystart=None, entrystop=None, flatten=False, flatname=None, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None, blocking=True):
-        t = uproot3.open(self._file._path)[self.name]
+        t = self._reopen()
         return t.iterate(branches, entrysteps, outputtype, namedecode, reportentries, entrystart, entrystop, flatten, flatname, awkwardlib, cache, basketcache, keycache, executor, blocking)
 
     def show(self, foldnames=False, stream=sys.stdout):
-        t = uproot3.open(self._file._path)[self.name]
+        t = self._reopen()
         return t.show(foldnames, stream)
 
     def matches(self, branches):
-        t = uproot3.open(self._file._path)[self.name]
+        t = self._reopen()
         return t.matches(branches)
 
     def __len__(self):
@@ -244,7 +249,7 @@ class TTree(object):
 
     @property
     def pandas(self):
-        t = uproot3.open(self._file._path)[self.name]
+        t = self._reopen()
         return t.pandas
 
 class TBranch(object):
@@ -270,13 +275,13 @@ class TBranch(object):
         if self._branch.fields["_fWriteBasket"] >= self._branch.fields["_fMaxBaskets"]:
             for branch in self._treelvl1._branches.values():
                 branch._branch.fields["_fMaxBaskets"] = branch._branch.fields["_fMaxBaskets"] * 2
-                temp_arr = numpy.array([0] * branch._branch.fields["_fMaxBaskets"], dtype=">i8")
+                temp_arr = numpy.zeros(branch._branch.fields["_fMaxBaskets"], dtype=">i8")
                 temp_arr[0:len(branch._branch.fields["_fBasketEntry"])] = branch._branch.fields["_fBasketEntry"]
                 branch._branch.fields["_fBasketEntry"] = temp_arr
-                temp_arr = numpy.array([0] * branch._branch.fields["_fMaxBaskets"], dtype=">i8")
+                temp_arr = numpy.zeros(branch._branch.fields["_fMaxBaskets"], dtype=">i8")
                 temp_arr[0:len(branch._branch.fields["_fBasketSeek"])] = branch._branch.fields["_fBasketSeek"]
                 branch._branch.fields["_fBasketSeek"] = temp_arr
-                temp_arr = numpy.array([0] * branch._branch.fields["_fMaxBaskets"], dtype=">i4")
+                temp_arr = numpy.zeros(branch._branch.fields["_fMaxBaskets"], dtype=">i4")
                 temp_arr[0:len(branch._branch.fields["_fBasketBytes"])] = branch._branch.fields["_fBasketBytes"]
                 branch._branch.fields["_fBasketBytes"] = temp_arr
 
@@ -333,9 +338,8 @@ class TBranch(object):
             self._branch.fields["_fEntryNumber"] = multidim
         self._branch.fields["_fBasketEntry"][self._branch.fields["_fWriteBasket"]] = self._branch.fields["_fEntries"]
         if isinstance(items, awkward0.array.jagged.JaggedArray):
-            givenbytes = b""
-            for i in range(items.shape[0]):
-                givenbytes += _tobytes(numpy.array(items[i], dtype=self._branch.type))
+            # the entries are contiguous in the basket, so the flattened content is the payload
+            givenbytes = _tobytes(numpy.array(items.flatten(), dtype=self._branch.type, copy=False))
         else:
             givenbytes = _tobytes(numpy.array(items, dtype=self._branch.type, copy=False))
 
@@ -363,11 +367,12 @@ class TBranch(object):
         if isinstance(items, awkward0.array.jagged.JaggedArray):
             # 3 looks like a harmless value for the first entry of offsetbytes
             # Relevant code - https://github.com/root-project/root/blob/master/tree/tree/src/TBasket.cxx#L921-L954
-            offsetbytes = [3, key.fKeylen]
-            for i in range(items.shape[0] - 1):
-                offsetbytes += [(len(items[i]) * numpy.dtype(self._branch.type).itemsize) + offsetbytes[-1]]
-            offsetbytes += [0]
-            offsetbytes = _tobytes(numpy.array(offsetbytes, dtype=">i4"))
+            offsetbytes = numpy.empty(items.shape[0] + 2, dtype=">i4")
+            offsetbytes[0] = 3
+            offsetbytes[1] = key.fKeylen
+            offsetbytes[2:-1] = key.fKeylen + numpy.cumsum(items.counts[:-1]) * numpy.dtype(self._branch.type).itemsize
+            offsetbytes[-1] = 0
+            offsetbytes = _tobytes(offsetbytes)
             uproot3.write.compress.write(self._branch.file, cursor, offsetbytes, self._branch.compression, key,
                                         copy(keycursor), isjagged=True)
 
@@ -388,11 +393,14 @@ class TBranch(object):
         self._branch._writebasket_cursor.update_fields(self._branch.file._sink, self._branch._format_tbranch12,
                                                        self._branch.fields["_fWriteBasket"], self._branch.fields["_fEntryNumber"])
         self._branch._fentries_cursor.update_fields(self._branch.file._sink, self._branch._format_fentries, self._branch.fields["_fEntries"])
-        self._branch._fbasketentry_cursor.update_array(self._branch.file._sink, self._branch.fields["_fBasketEntry"])
-        self._branch._fbasketseek_cursor.update_array(self._branch.file._sink, self._branch.fields["_fBasketSeek"])
+        # only the slots for this basket changed; the rest of each array is already in the file
+        self._branch._fbasketentry_cursor.update_element(self._branch.file._sink, self._branch.fields["_fBasketEntry"], self._branch.fields["_fWriteBasket"])
+        self._branch._fbasketseek_cursor.update_element(self._branch.file._sink, self._branch.fields["_fBasketSeek"], self._branch.fields["_fWriteBasket"] - 1)
         self._branch._tbranch_size_cursor.update_fields(self._branch.file._sink, self._branch._format_branch_size,
                                                         self._branch.fields["_fTotBytes"], self._branch.fields["_fZipBytes"])
-        self._branch._fbasketbytes_cursor.update_array(self._branch.file._sink, self._branch.fields["_fBasketBytes"])
+        self._branch._fbasketbytes_cursor.update_element(self._branch.file._sink, self._branch.fields["_fBasketBytes"], self._branch.fields["_fWriteBasket"] - 1)
+        if self._branch.file._batchdepth == 0:
+            self._branch.file._sink.flush()
 
     @property
     def name(self):
@@ -404,136 +412,136 @@ class TBranch(object):
 
     @property
     def interpretation(self):
-        b = uproot3.open(self._treelvl1._file._path)[self._treelvl1.name][self.name]
+        b = self._treelvl1._reopen()[self.name]
         return b.interpretation
 
     @property
     def countbranch(self):
-        b = uproot3.open(self._treelvl1._file._path)[self._treelvl1.name][self.name]
+        b = self._treelvl1._reopen()[self.name]
         return b.countbranch
 
     @property
     def countleaf(self):
-        b = uproot3.open(self._treelvl1._file._path)[self._treelvl1.name][self.name]
+        b = self._treelvl1._reopen()[self.name]
         return b.countleaf
 
     @property
     def numentries(self):
-        b = uproot3.open(self._treelvl1._file._path)[self._treelvl1.name][self.name]
+        b = self._treelvl1._reopen()[self.name]
         return b.numentries
 
     @property
     def numbranches(self):
-        b = uproot3.open(self._treelvl1._file._path)[self._treelvl1.name][self.name]
+        b = self._treelvl1._reopen()[self.name]
         return b.numbranches
 
     def iterkeys(self, recursive=False, filtername=nofilter, filtertitle=nofilter):
-        b = uproot3.open(self._treelvl1._file._path)[self._treelvl1.name][self.name]
+        b = self._treelvl1._reopen()[self.name]
         return b.iterkeys(recursive, filtername, filtertitle)
 
     def itervalues(self, recursive=False, filtername=nofilter, filtertitle=nofilter):
-        b = uproot3.open(self._treelvl1._file._path)[self._treelvl1.name][self.name]
+        b = self._treelvl1._reopen()[self.name]
         return b.itervalues(recursive, filtername, filtertitle)
 
     def iteritems(self, recursive=False, filtername=nofilter, filtertitle=nofilter):
-        b = uproot3.open(self._treelvl1._file._path)[self._treelvl1.name][self.name]
+        b = self._treelvl1._reopen()[self.name]
         return b.iteritems(recursive, filtername, filtertitle)
 
     def keys(self, recursive=False, filtername=nofilter, filtertitle=nofilter):
-        b = uproot3.open(self._treelvl1._file._path)[self._treelvl1.name][self.name]
+        b = self._treelvl1._reopen()[self.name]
         return b.keys(recursive, filtername, filtertitle)
 
     def values(self, recursive=False, filtername=nofilter, filtertitle=nofilter):
-        b = uproot3.open(self._treelvl1._file._path)[self._treelvl1.name][self.name]
+        b = self._treelvl1._reopen()[self.name]
         return b.keys(recursive, filtername, filtertitle)
 
     def items(self, recursive=False, filtername=nofilter, filtertitle=nofilter):
-        b = uproot3.open(self._treelvl1._file._path)[self._treelvl1.name][self.name]
+        b = self._treelvl1._reopen()[self.name]
         return b.items(recursive, filtername, filtertitle)
 
     def allkeys(self, recursive=False, filtername=nofilter, filtertitle=nofilter):
-        b = uproot3.open(self._treelvl1._file._path)[self._treelvl1.name][self.name]
+        b = self._treelvl1._reopen()[self.name]
         return b.allkeys(recursive, filtername, filtertitle)
 
     def allvalues(self, filtername=nofilter, filtertitle=nofilter):
-        b = uproot3.open(self._treelvl1._file._path)[self._treelvl1.name][self.name]
+        b = self._treelvl1._reopen()[self.name]
         return b.keys(filtername, filtertitle)
 
     def allitems(self, filtername=nofilter, filtertitle=nofilter):
-        b = uproot3.open(self._treelvl1._file._path)[self._treelvl1.name][self.name]
+        b = self._treelvl1._reopen()[self.name]
         return b.allitems(filtername, filtertitle)
 
     def get(self, name, recursive=True, filtername=nofilter, filtertitle=nofilter, aliases=True):
-        b = uproot3.open(self._treelvl1._file._path)[self._treelvl1.name][self.name]
+        b = self._treelvl1._reopen()[self.name]
         return b.get(name, recursive, filtername, filtertitle, aliases)
 
     @property
     def numbaskets(self):
-        b = uproot3.open(self._treelvl1._file._path)[self._treelvl1.name][self.name]
+        b = self._treelvl1._reopen()[self.name]
         return b.numbaskets
 
     def uncompressedbytes(self, keycache=None):
-        b = uproot3.open(self._treelvl1._file._path)[self._treelvl1.name][self.name]
+        b = self._treelvl1._reopen()[self.name]
         return b.uncompressedbhytes(keycache)
 
     def compressedbytes(self, keycache=None):
-        b = uproot3.open(self._treelvl1._file._path)[self._treelvl1.name][self.name]
+        b = self._treelvl1._reopen()[self.name]
         return b.compressedbhytes(keycache)
 
     def compressionratio(self, keycache=None):
-        b = uproot3.open(self._treelvl1._file._path)[self._treelvl1.name][self.name]
+        b = self._treelvl1._reopen()[self.name]
         return b.compressionratio(keycache)
 
     def numitems(self, interpretation=None, keycache=None):
-        b = uproot3.open(self._treelvl1._file._path)[self._treelvl1.name][self.name]
+        b = self._treelvl1._reopen()[self.name]
         return b.numitems(interpretation, keycache)
 
     def basket_entrystart(self, i):
-        b = uproot3.open(self._treelvl1._file._path)[self._treelvl1.name][self.name]
+        b = self._treelvl1._reopen()[self.name]
         return b.basket_entrystart(i)
 
     def basket_entrystop(self, i):
-        b = uproot3.open(self._treelvl1._file._path)[self._treelvl1.name][self.name]
+        b = self._treelvl1._reopen()[self.name]
         return b.basket_entrystop(i)
 
     def basket_numentries(self, i):
-        b = uproot3.open(self._treelvl1._file._path)[self._treelvl1.name][self.name]
+        b = self._treelvl1._reopen()[self.name]
         return b.basket_numentries(i)
 
     def basket_uncompressedbytes(self, i, keycache=None):
-        b = uproot3.open(self._treelvl1._file._path)[self._treelvl1.name][self.name]
+        b = self._treelvl1._reopen()[self.name]
         return b.basket_uncompressedbytes(i, keycache)
 
     def basket_compressedbytes(self, i):
-        b = uproot3.open(self._treelvl1._file._path)[self._treelvl1.name][self.name]
+        b = self._treelvl1._reopen()[self.name]
         return b.basked_compressedbytes(i)
 
     def basket_numitems(self, i, interpretation=None, keycache=None):
-        b = uproot3.open(self._treelvl1._file._path)[self._treelvl1.name][self.name]
+        b = self._treelvl1._reopen()[self.name]
         return b.basket_numitems(i, interpretation, keycache)
 
     def basket(self, i, interpretation=None, entrystart=None, entrystop=None, flatten=False, awkwardlib=None, cache=None, basketcache=None, keycache=None):
-        b = uproot3.open(self._treelvl1._file._path)[self._treelvl1.name][self.name]
+        b = self._treelvl1._reopen()[self.name]
         return b.basket(i, interpretation, entrystart, entrystop, flatten, awkwardlib, cache, basketcache, keycache)
 
     def baskets(self, interpretation=None, entrystart=None, entrystop=None, flatten=False, awkwardlib=None, cache=None, basketcache=None, keycache=None, reportentries=False, executor=None, blocking=True):
-        b = uproot3.open(self._treelvl1._file._path)[self._treelvl1.name][self.name]
+        b = self._treelvl1._reopen()[self.name]
         return b.baskets(interpretation, entrystart, entrystop, flatten, awkwardlib, cache, basketcache, keycache, reportentries, executor, blocking)
 
     def iterate_baskets(self, interpretation=None, entrystart=None, entrystop=None, flatten=False, awkwardlib=None, cache=None, basketcache=None, keycache=None, reportentries=False):
-        b = uproot3.open(self._treelvl1._file._path)[self._treelvl1.name][self.name]
+        b = self._treelvl1._reopen()[self.name]
         return b.baskets(interpretation, entrystart, entrystop, flatten, awkwardlib, cache, basketcache, keycache, reportentries)
 
     def array(self, interpretation=None, entrystart=None, entrystop=None, flatten=False, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None, blocking=True):
-        b = uproot3.open(self._treelvl1._file._path)[self._treelvl1.name][self.name]
+        b = self._treelvl1._reopen()[self.name]
         return b.array(interpretation, entrystart, entrystop, flatten, awkwardlib, cache, basketcache, keycache, executor, blocking)
 
     def mempartitions(self, numbytes, entrystart=None, entrystop=None, keycache=None, linear=True):
-        b = uproot3.open(self._treelvl1._file._path)[self._treelvl1.name][self.name]
+        b = self._treelvl1._reopen()[self.name]
         return b.mempartitions(numbytes, entrystart, entrystop, keycache, linear)
 
     def lazyarray(self, interpretation=None, entrysteps=None, entrystart=None, entrystop=None, flatten=False, awkwardlib=None, cache=None, basketcache=None, keycache=None, executor=None, persistvirtual=False):
-        b = uproot3.open(self._treelvl1._file._path)[self._treelvl1.name][self.name]
+        b = self._treelvl1._reopen()[self.name]
         return b.lazyarray(interpretation, entrysteps, entrystart, entrystop, flatten, awkwardlib, cache, basketcache, keycache, executor, persistvirtual)
 
 class TTreeImpl(object):
@@ -10,6 +10,8 @@ import sys
 from uproot3._util import _tobytes
 
 class Cursor(object):
+    __slots__ = ("index",)
+
     def __init__(self, index):
         self.index = index
 
@@ -42,22 +44,24 @@ class Cursor(object):
     _format_byteint = struct.Struct(">Bi")
     def update_string(self, sink, data):
         if len(data) < 255:
-            sink.write(self._format_byte.pack(len(data)), self.index)
-            sink.write(data, self.index + 1)
+            sink.write(self._format_byte.pack(len(data)) + data, self.index)
         else:
-            sink.write(self._format_byteint.pack(255, len(data)), self.index)
-            sink.write(data, self.index + 5)
+            sink.write(self._format_byteint.pack(255, len(data)) + data, self.index)
 
     def write_string(self, sink, data):
         self.update_string(sink, data)
         self.index += self.length_string(data)
 
     def put_string(self, data):
-        self.index += self.length_string(data)
+        return self.put_stringlength(data) + self.put_data(data)
+
+    def put_stringlength(self, data):
         if len(data) < 255:
-            return self._format_byte.pack(len(data)) + data
+            self.index += self._format_byte.size
+            return self._format_byte.pack(len(data))
         else:
-            return self._format_byteint.pack(255, len(data)) + data
+            self.index += self._format_byteint.size
+            return self._format_byteint.pack(255, len(data))
 
     def update_cstring(self, sink, data):
         sink.write(data, self.index)
@@ -89,6 +93,9 @@ class Cursor(object):
     def update_array(self, sink, data):
         sink.write(_tobytes(data), self.index)
 
+    def update_element(self, sink, data, i):
+        sink.write(_tobytes(data[i:i + 1]), self.index + i * data.itemsize)
+
     def write_array(self, sink, data):
         self.update_array(sink, data)
         self.index += data.nbytes
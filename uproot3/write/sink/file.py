@@ -4,29 +4,104 @@
 
 from __future__ import absolute_import
 
+import os
+import threading
+
+try:
+    _iovmax = os.sysconf("SC_IOV_MAX")
+except (AttributeError, ValueError, OSError):
+    _iovmax = 1024
+if _iovmax <= 0:
+    _iovmax = 1024
+
 class Sink(object):
     pass
 
 class FileSink(Sink):
-    def __init__(self, path):
+    def __init__(self, path, limitbytes=16*1024**2):
         self._path = path
         self._sink = open(path, "wb+")
-        # self._pos = 0
+        self._limitbytes = limitbytes
+        self._pending = []
+        self._pendingbytes = 0
+        self._writer = None
+        self._writererror = None
 
     def write(self, data, pos):
-        self._sink.seek(pos)
-        self._sink.write(data)
+        if self._sink.closed:
+            raise ValueError("I/O operation on closed file {0}".format(repr(self._path)))
+        # writes are queued and issued together, so that many small field updates cost one system call per contiguous run
+        self._pending.append((pos, data))
+        self._pendingbytes += len(data)
+        if self._pendingbytes >= self._limitbytes:
+            # a full queue is written by a background thread while the next one fills; at most one is in flight, so writes stay in order
+            self._join()
+            self._writer = threading.Thread(target=self._writebackground, args=(self._pending,))
+            self._writer.daemon = True
+            self._pending = []
+            self._pendingbytes = 0
+            self._writer.start()
+
+    def _writebackground(self, pending):
+        try:
+            self._writepending(pending)
+        except Exception as err:
+            self._writererror = err
+
+    def _join(self):
+        if self._writer is not None:
+            self._writer.join()
+            self._writer = None
+            if self._writererror is not None:
+                err, self._writererror = self._writererror, None
+                raise err
+
+    def _drain(self):
+        self._join()
+        self._writepending(self._pending)
+        self._pending = []
+        self._pendingbytes = 0
+
+    def _writepending(self, pending):
+        runs = []
+        for pos, data in pending:
+            if len(runs) > 0 and runs[-1][0] + runs[-1][1] == pos:
+                runs[-1][1] += len(data)
+                runs[-1][2].append(data)
+            else:
+                runs.append([pos, len(data), [data]])
+
+        for pos, numbytes, chunks in runs:
+            self._writeat(chunks, pos)
+
+    def _writeat(self, chunks, pos):
+        # a short write can stop anywhere, even inside a chunk, so each call resumes where the last one stopped
+        if hasattr(os, "pwritev"):
+            fd = self._sink.fileno()
+            views = [memoryview(x) for x in chunks]
+            while len(views) > 0:
+                numwritten = os.pwritev(fd, views[:_iovmax], pos)
+                pos += numwritten
+                i = 0
+                while i < len(views) and numwritten >= len(views[i]):
+                    numwritten -= len(views[i])
+                    i += 1
+                views = views[i:]
+                if numwritten > 0:
+                    views[0] = views[0][numwritten:]
 
-    # def write(self, data, pos):
-    #     if self._sink.tell() != pos:
-    #         self._sink.seek(pos)
-    #     self._sink.write(data)
+        elif hasattr(os, "pwrite"):
+            fd = self._sink.fileno()
+            view = memoryview(chunks[0] if len(chunks) == 1 else b"".join(chunks))
+            while len(view) > 0:
+                numwritten = os.pwrite(fd, view, pos)
+                view = view[numwritten:]
+                pos += numwritten
 
-    # def write(self, data, pos):
-    #     if self._pos != pos:
-    #         self._sink.seek(pos)
-    #     self._sink.write(data)
-    #     self._pos += len(data)    # needs self._pos
+        else:
+            self._sink.seek(pos)
+            for data in chunks:
+                self._sink.write(data)
 
     @property
     def closed(self):
@@ -34,8 +109,12 @@ class FileSink(Sink):
 
     def close(self):
         if not self._sink.closed:
-            self._sink.close()
+            try:
+                self._drain()
+            finally:
+                self._sink.close()
 
     def flush(self):
         if not self._sink.closed:
+            self._drain()
             self._sink.flush()